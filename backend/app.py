@@ -1,10 +1,19 @@
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 import uvicorn
-from openai_service import get_openai_completion
+from openai_service import get_openai_completion, init_openai_client, close_openai_client
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_openai_client()
+    yield
+    await close_openai_client()
+
+
+app = FastAPI(lifespan=lifespan)
 
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -26,7 +35,7 @@ def home():
 async def openai_completion(request: Request):
     data = await request.json()
     prompt = data.get("prompt", "")
-    result = get_openai_completion(prompt)
+    result = await get_openai_completion(prompt)
     if "error" in result:
         return JSONResponse(content={"error": result["error"]}, status_code=result["status_code"])
     return JSONResponse(content={"response": result["response"]}, status_code=result["status_code"])
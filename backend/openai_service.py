@@ -1,19 +1,42 @@
-
 import os
 import openai
 
 # Load OpenAI API key from environment variable
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
+# Shared client so requests reuse one HTTP connection pool instead of
+# opening a new one (and a new TLS handshake) per completion
+_client = None
+
+
+def get_openai_client():
+    global _client
+    if _client is None:
+        _client = openai.AsyncOpenAI()
+    return _client
+
+
+def init_openai_client():
+    # Build the client at startup so the first requests don't race to create it.
+    # Without a key we leave it lazy, so each request reports the error instead
+    # of the app failing to start.
+    if openai.api_key:
+        get_openai_client()
+
 
+async def close_openai_client():
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
 
 
-def get_openai_completion(prompt: str, model: str = "gpt-3.5-turbo", max_tokens: int = 300):
+async def get_openai_completion(prompt: str, model: str = "gpt-3.5-turbo", max_tokens: int = 300):
     if not prompt:
         return {"error": "Prompt is required.", "status_code": 400}
     try:
-        client = openai.OpenAI()
-        response = client.chat.completions.create(
+        client = get_openai_client()
+        response = await client.chat.completions.create(
             model=model,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=max_tokens